@@ -14,6 +14,7 @@ import logging
 import os
 import sys
 from confluent_kafka import KafkaError
+from .util import _loads
 
 ENCODING = 'utf-8'
 
@@ -70,7 +71,7 @@ class ApplicationMessageBase():
         """Decode JSON message and log errors."""
         if msg:
             if not msg.error():
-                return json.loads(msg.value().decode(ENCODING))
+                return _loads(msg.value())
 
             elif msg.error().code() != KafkaError._PARTITION_EOF:
                 self.logger.error(msg.error().code())
@@ -81,8 +82,30 @@ class ApplicationMessageBase():
 
         Before returning a message, make sure the run_id is not part of the ignored list from stopped policies.
         """
+        return self._decode_work_message(self.kafka_consumer.poll(timeout=timeout))
+
+    def read_messages(self, num_messages=100, timeout=10):
+        """
+        Read a batch of JSON messages and log errors.
+
+        Applies the same checks as read_message to every message in the batch. Returns a
+        tuple of the decoded messages and the last raw Kafka message of the batch (None
+        if nothing was consumed). Pass the latter to commit_batch once the batch has been
+        processed, so skipped messages are committed as well.
+        """
+        raw_msgs = self.application.consume_batch(num_messages=num_messages, timeout=timeout)
+
+        msgs = []
+        for raw_msg in raw_msgs:
+            msg = self._decode_work_message(raw_msg)
+            if msg:
+                msgs.append(msg)
+
+        return msgs, raw_msgs[-1] if raw_msgs else None
+
+    def _decode_work_message(self, msg_string):
+        """Decode a raw work message, dropping errors and messages of stopped policies."""
         msg = None
-        msg_string = self.kafka_consumer.poll(timeout=timeout)
         if msg_string:
             try:
                 msg = self.decode_msg(msg_string)
@@ -99,12 +122,21 @@ class ApplicationMessageBase():
 
         return msg
 
-    def send_reply(self, response_msg):
-        """Send message on kafka completion queue."""
+    def send_reply(self, response_msg, commit=True):
+        """Send message on kafka completion queue.
+
+        By default the reply is flushed and the consumer position committed. Pass
+        commit=False when processing a batch from read_messages(), and commit the
+        whole batch with commit_batch() once it is done.
+        """
         self.kafka_producer.produce(self.compl_q_name, str(response_msg))
-        self.kafka_producer.flush()
 
-        self.kafka_consumer.commit()
+        if commit:
+            self.kafka_producer.flush()
+            self.kafka_consumer.commit()
+        else:
+            # Serve delivery callbacks without waiting for the reply to be sent
+            self.kafka_producer.poll(0)
 
 
 class ApplicationReplyMessage():
@@ -148,10 +148,10 @@ class DocumentRetrievalBase():
                 self.stat_atime = stat.st_atime
                 self.stat_mtime = stat.st_mtime
 
-            self.logger.debug('Successfully retrieved stat info for %s. atime: %s, mtime: %s', filepath, str(self.stat_atime),
-                              str(self.stat_mtime))
+            self.logger.debug('Successfully retrieved stat info for %s. atime: %s, mtime: %s', filepath, self.stat_atime,
+                              self.stat_mtime)
         except (PermissionError, FileNotFoundError) as error:
-            self.logger.error('Failed to retrieve stat info for %s. Error: %s', filepath, str(error))
+            self.logger.error('Failed to retrieve stat info for %s. Error: %s', filepath, error)
             self.stat_atime = None
             self.stat_mtime = None
 
@@ -165,10 +165,10 @@ class DocumentRetrievalBase():
                 else:
                     method.utime(filepath, (self.stat_atime, self.stat_mtime))
 
-                self.logger.debug('Successfully restored stat info for %s. atime: %s, mtime: %s', filepath, str(self.stat_atime),
-                                  str(self.stat_mtime))
+                self.logger.debug('Successfully restored stat info for %s. atime: %s, mtime: %s', filepath, self.stat_atime,
+                                  self.stat_mtime)
             except (PermissionError, FileNotFoundError, OSError) as error:
-                self.logger.error('Failed to restore stat info for %s. Error: %s', filepath, str(error))
+                self.logger.error('Failed to restore stat info for %s. Error: %s', filepath, error)
 
 class DocumentRetrievalCOS(DocumentRetrievalBase):
     """Create a COS document class.
@@ -259,7 +259,7 @@ class DocumentRetrievalNFS(DocumentRetrievalBase):
             check_call(cmd, shell=True)
         except CalledProcessError as cpe:
             self.logger.warning('Failed to to unmount NFS export %s for connection %s. Error: %s', mount_point,
-                                self.connection['name'], str(cpe))
+                                self.connection['name'], cpe)
 
 
 class DocumentRetrievalScale(DocumentRetrievalBase):
@@ -377,7 +377,7 @@ class DocumentRetrievalSMB(DocumentRetrievalBase):
             check_call(cmd, shell=True)
         except CalledProcessError as cpe:
             self.logger.warning('Failed to to unmount SMB export %s for connection %s. Error: %s', mount_point,
-                                self.connection['name'], str(cpe))
+                                self.connection['name'], cpe)
 
 
 class DocumentKey(object):
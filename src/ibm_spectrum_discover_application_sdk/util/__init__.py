@@ -8,3 +8,11 @@
 # disclosure restricted by GSA ADP Schedule Contract with IBM Corp.
 # ========================================================
 """This package contains namespace implementations."""
+
+# JSON parser shared by the SDK modules, using the faster orjson when it is installed
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+_loads = _json.loads